@@ -4,40 +4,63 @@ Main entry point for doxy2mdx - Convert Doxygen XML to MDX files for Docusaurus
 """
 
 import argparse
-import yaml
+import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Optional
 
-from .converter_simple import DoxygenToMDXConverter
 from .converter_mdx_with_react import DoxygenToMDXWithReactConverter
 from .converter_react import DoxygenToReactConverter
+from .converter_simple import DoxygenToMDXConverter
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    'input_xml_dir': './xml',
+    'output_mdx_dir': './mdx',
+    'css_output_path': './doxygen.css',
+    'project_name': 'Project',
+    'heading_offset': 0,
+    'emit_index': True,
+    'mode': 'simple',  # simple, react, raw
+    'components_path': './components/doxygen.jsx',
+    'incremental': False,  # skip files whose output is newer than their XML (react and raw modes)
+    'jobs': None,  # worker processes; None uses every CPU
+    'skip_prefixes': ['index'],  # XML files whose names start with these are not converted
+}
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, _mtime_ns: int) -> Dict[str, Any]:
+    """Load and merge a YAML configuration file, cached on its path and mtime"""
+    # Only pay for importing PyYAML when a config file is actually given
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    
+    config = dict(DEFAULT_CONFIG)
+    
+    with open(config_path, 'r', encoding='utf-8') as f:
+        user_config = yaml.load(f, Loader=Loader) or {}
+    
+    # Merge user config with defaults
+    for key, value in user_config.items():
+        if key in config:
+            config[key] = value
+    
+    return config
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from YAML file or use defaults"""
-    default_config = {
-        'input_xml_dir': './xml',
-        'output_mdx_dir': './mdx',
-        'css_output_path': './doxygen.css',
-        'project_name': 'Project',
-        'heading_offset': 0,
-        'emit_index': True,
-        'mode': 'simple',  # simple, react, raw
-        'components_path': './components/doxygen.jsx'
-    }
-    
     if config_path and os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            user_config = yaml.safe_load(f) or {}
-        
-        # Merge user config with defaults
-        for key, value in user_config.items():
-            if key in default_config:
-                default_config[key] = value
+        config_path = os.path.abspath(config_path)
+        # Hand out a copy so callers can override keys without touching the cache
+        return dict(_load_config_cached(config_path, os.stat(config_path).st_mtime_ns))
     
-    return default_config
+    return dict(DEFAULT_CONFIG)
 
 
 def parse_args() -> Dict[str, Any]:
@@ -120,6 +143,18 @@ Examples:
         help='Path to React components file (for react mode)'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help='Number of worker processes (default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip files whose output is newer than their XML (react and raw modes)'
+    )
+    
     args = parser.parse_args()
     
     # Load base configuration
@@ -150,6 +185,12 @@ Examples:
     if args.components_path:
         config['components_path'] = args.components_path
     
+    if args.incremental:
+        config['incremental'] = True
+    
+    if args.jobs is not None:
+        config['jobs'] = args.jobs
+    
     return config
 
 
@@ -165,17 +206,16 @@ def validate_config(config: Dict[str, Any]) -> bool:
         print(f"Error: Input path is not a directory: {input_dir}")
         return False
     
-    # Check if there are XML files in the input directory
-    xml_files = list(input_dir.glob("*.xml"))
-    if not xml_files:
+    # Check if there are XML files in the input directory, stopping at the first one
+    with os.scandir(input_dir) as entries:
+        has_xml = any(e.name.endswith('.xml') for e in entries)
+    if not has_xml:
         print(f"Warning: No XML files found in input directory: {input_dir}")
     
     return True
 
 
-def generate_css_file(output_path: str):
-    """Generate CSS file for styling doxygen elements"""
-    css_content = """/* Doxygen to MDX CSS Styles */
+DOXYGEN_CSS = """/* Doxygen to MDX CSS Styles */
 :root {
   --doxygen-accent: #0f766e;
   --doxygen-muted: #6b7280;
@@ -324,12 +364,15 @@ def generate_css_file(output_path: str):
   }
 }
 """
+
+
+def generate_css_file(output_path: str):
+    """Generate CSS file for styling doxygen elements"""
     
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(css_content)
+    Path(output_path).write_bytes(DOXYGEN_CSS.encode('utf-8'))
     
     print(f"CSS file generated: {output_path}")
 
@@ -337,6 +380,9 @@ def generate_css_file(output_path: str):
 def main():
     """Main entry point for doxy2mdx"""
     try:
+        # Converters report progress and errors through logging
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        
         # Parse command line arguments
         config = parse_args()
         
@@ -1,8 +1,19 @@
+import contextlib
 import os
-import pygixml
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import re
+from typing import IO, Any, Callable, ClassVar, Dict
+
+import pygixml
+
+from .utils import CLASS_SECTIONS, SIDEBAR_PREFIX_RE, convert_worker
+
+# Nothing shorter than this can hold a compounddef element
+_MIN_XML_SIZE = len('<compounddef/>')
+
+_PARAMS_HEADER = '#### Parameters\n\n'
+_RETURNS_HEADER = '#### Returns\n\n'
 
 
 class DoxygenToMDXConverter:
@@ -13,341 +24,348 @@ class DoxygenToMDXConverter:
         
     def convert_directory(self, input_dir: str, output_dir: str):
         """Convert all XML files in input directory to MDX files in output directory"""
-        input_path = Path(input_dir)
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        for xml_file in input_path.glob("*.xml"):
-            if xml_file.name.startswith("index"):
-                continue
-                
-            mdx_content = self.convert_file(str(xml_file))
-            if mdx_content:
-                output_file = output_path / f"{xml_file.stem}.mdx"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(mdx_content)
-                print(f"Converted: {xml_file.name} -> {output_file.name}")
+        # Skip files whose output is never wanted before paying for a parse
+        skip_prefixes = tuple(self.config.get('skip_prefixes', ('index',)))
+        with os.scandir(input_dir) as entries:
+            xml_files = [
+                e.path for e in entries
+                if e.name.endswith('.xml') and not e.name.startswith(skip_prefixes)
+                and e.is_file(follow_symlinks=False) and e.stat(follow_symlinks=False).st_size >= _MIN_XML_SIZE
+            ]
+        output_files = [str(output_path / f"{Path(xml_file).stem}.mdx") for xml_file in xml_files]
+        
+        # Files are independent, so parse, render and write them in parallel
+        with ProcessPoolExecutor(max_workers=self.config.get('jobs') or None) as executor:
+            results = executor.map(
+                convert_worker, repeat(type(self)), repeat(self.config), xml_files, output_files, chunksize=8
+            )
+            for xml_file, output_file, converted in zip(xml_files, output_files, results):
+                if converted:
+                    print(f"Converted: {Path(xml_file).name} -> {Path(output_file).name}")
     
-    def convert_file(self, xml_file: str) -> Optional[str]:
-        """Convert a single XML file to MDX content"""
+    def convert_file_to_path(self, xml_file: str, output_file: str) -> bool:
+        """Convert a single XML file into an MDX file, leaving any previous output untouched on failure"""
+        # Stream into a sibling temp file and only move it over the output once it is complete
+        tmp_file = output_file + '.tmp'
         try:
-            doc = pygixml.parse_file(xml_file)
-            root = doc.first_child()
-            
-            if not root:
-                return None
-                
-            # Get compound name and kind
-            compound = root.child('compounddef')
-            if not compound:
-                return None
-                
-            compound_name = compound.attribute('id') or ''
-            compound_kind = compound.attribute('kind') or ''
-            
-            # Start building MDX content
-            mdx_lines = []
-            
-            # Add frontmatter for Docusaurus
-            mdx_lines.extend([
-                '---',
-                f'title: {self._get_title(compound)}',
-                f'sidebar_label: {self._get_sidebar_label(compound)}',
-                '---',
-                ''
-            ])
-            
-            # Add main content
-            mdx_lines.extend(self._render_compound(compound))
-            
-            return '\n'.join(mdx_lines)
-            
-        except Exception as e:
+            with open(tmp_file, 'w', encoding='utf-8', newline='\n', buffering=1 << 16) as f:
+                converted = self.convert_file(xml_file, f)
+            if converted:
+                os.replace(tmp_file, output_file)
+            return converted
+        finally:
+            # Gone already after a successful replace, or never created if open() failed
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_file)
+    
+    def convert_file(self, xml_file: str, out: IO[str]) -> bool:
+        """Convert a single XML file to MDX content written to out"""
+        try:
+            # Stream the file and only build the compounddef subtree
+            compound = next(pygixml.iterfind(xml_file, 'compounddef'), None)
+        except (OSError, pygixml.PygiXMLError) as e:
             print(f"Error parsing XML file {xml_file}: {e}")
-            return None
+            return False
+        
+        if compound is None:
+            return False
+        
+        # Add frontmatter for Docusaurus; the label is derived from the title, so look it up once
+        title = self._get_title(compound)
+        out.write(
+            '---\n'
+            f'title: {title}\n'
+            f'sidebar_label: {self._get_sidebar_label(title)}\n'
+            '---\n'
+            '\n'
+        )
+        
+        # Add main content
+        self._render_compound(compound, out)
+        
+        # Release the subtree as soon as it has been rendered
+        compound.clear()
+        
+        return True
     
-    def _get_title(self, compound: pygixml.XMLNode) -> str:
+    def _get_title(self, compound: pygixml.StreamElement) -> str:
         """Extract title from compound element"""
-        title_elem = compound.child('title')
-        if title_elem and title_elem.child_value():
-            return title_elem.child_value().strip()
+        title_elem = compound.find('title')
+        title = title_elem.text if title_elem is not None else None
+        if title:
+            return title.strip()
         
         # Fallback to compound name
-        compound_name = compound.attribute('id') or ''
+        compound_name = compound.get('id', '')
         if compound_name:
-            print(str(compound_name))
-            return str(compound_name).replace('_', ' ').title()
+            return compound_name.replace('_', ' ').title()
         return 'Untitled'
     
-    def _get_sidebar_label(self, compound: pygixml.XMLNode) -> str:
-        """Generate sidebar label from compound"""
-        title = self._get_title(compound)
+    def _get_sidebar_label(self, title: str) -> str:
+        """Generate sidebar label from a compound title"""
         # Remove common prefixes and make it shorter
-        label = re.sub(r'^(class|struct|namespace|file)\s+', '', title)
-        return label
+        return SIDEBAR_PREFIX_RE.sub('', title)
     
-    def _render_compound(self, compound: pygixml.XMLNode) -> List[str]:
-        """Render a compound definition to MDX lines"""
-        lines = []
-        
+    def _render_compound(self, compound: pygixml.StreamElement, out: IO[str]) -> None:
+        """Render a compound definition to MDX"""
         # Add compound description
-        brief_desc = compound.child('briefdescription')
-        if brief_desc:
-            brief_text = self._render_description(brief_desc)
-            if brief_text:
-                lines.extend([brief_text, ''])
+        brief_desc = compound.find('briefdescription')
+        if brief_desc is not None:
+            self._render_description(brief_desc, out)
         
         # Add detailed description
-        detailed_desc = compound.child('detaileddescription')
-        if detailed_desc:
-            detailed_text = self._render_description(detailed_desc)
-            if detailed_text:
-                lines.extend([detailed_text, ''])
+        detailed_desc = compound.find('detaileddescription')
+        if detailed_desc is not None:
+            self._render_description(detailed_desc, out)
         
         # Add sections based on compound kind
-        compound_kind = compound.attribute('kind') or ''
+        compound_kind = compound.get('kind', '')
         
         if compound_kind in ['class', 'struct']:
-            lines.extend(self._render_class_members(compound))
+            self._render_class_members(compound, out)
         elif compound_kind == 'namespace':
-            lines.extend(self._render_namespace_members(compound))
+            self._render_namespace_members(compound, out)
         elif compound_kind == 'file':
-            lines.extend(self._render_file_contents(compound))
-        
-        return lines
+            self._render_file_contents(compound, out)
     
-    def _render_description(self, description: pygixml.XMLNode) -> str:
+    def _render_description(self, description: pygixml.StreamElement, out: IO[str]) -> None:
         """Render a description element to markdown"""
-        paragraphs = []
-        
-        # Find all para elements using XPath
-        paras = description.select_nodes('.//para')
-        for para_node in paras:
-            para = para_node.node()  # Get the XMLNode from XPathNode
-            if para:
-                para_text = self._render_paragraph(para)
-                if para_text:
-                    paragraphs.append(para_text)
-        
-        return '\n\n'.join(paragraphs)
+        # Most descriptions are empty elements; skip the paragraph walk for them
+        if description is None or not len(description):
+            return
+        
+        # Bind the hot-loop callables once per description
+        render_paragraph = self._render_paragraph
+        write = out.write
+        
+        # Find all para elements
+        for para in description.iter('para'):
+            para_text = render_paragraph(para)
+            if para_text:
+                write(para_text + '\n\n')
     
-    def _render_paragraph(self, para: pygixml.XMLNode) -> str:
+    def _render_paragraph(self, para: pygixml.StreamElement) -> str:
         """Render a paragraph element to markdown"""
+        text = para.text
+        
+        # Plain-text (or empty) paragraphs need no inline handling
+        if not len(para):
+            return text.strip() if text else ''
+        
         text_parts = []
+        append = text_parts.append
         
-        # Get text content using text() method
-        text_content = para.text()
-        if text_content:
-            text_parts.append(text_content.strip())
+        # Get text content
+        if text:
+            append(text.strip())
         
-        # Handle child elements
+        # Handle child elements, falling back to a div for unknown elements
+        get_handler = self._INLINE_HANDLERS.get
+        wrap_unknown = self._wrap_unknown_element
         for child in para:
-            if child.name == 'computeroutput':
-                text_parts.append(f'`{self._get_element_text(child)}`')
-            elif child.name == 'bold':
-                text_parts.append(f'**{self._get_element_text(child)}**')
-            elif child.name == 'emphasis':
-                text_parts.append(f'*{self._get_element_text(child)}*')
-            elif child.name == 'ulink':
-                url = child.attribute('url') or ''
-                text_parts.append(f'[{self._get_element_text(child)}]({url})')
-            elif child.name == 'ref':
-                refid = child.attribute('refid') or ''
-                text_parts.append(f'[{self._get_element_text(child)}](./{refid})')
-            elif child.name == 'programlisting':
-                code = self._render_code_block(child)
-                text_parts.append(f'\n{code}\n')
-            else:
-                # Fallback to div for unknown elements
-                text_parts.append(self._wrap_unknown_element(child))
+            handler = get_handler(child.tag)
+            append(handler(self, child) if handler else wrap_unknown(child))
+            
+            # Add tail text
+            tail = child.tail
+            if tail:
+                append(tail.strip())
         
-        result = ' '.join(text_parts).strip()
-        return result if result else ''
+        return ' '.join(text_parts).strip()
     
-    def _render_code_block(self, programlisting: pygixml.XMLNode) -> str:
+    def _render_code_block(self, programlisting: pygixml.StreamElement) -> str:
         """Render a code block to markdown"""
         code_lines = []
         
-        # Find all codeline elements using XPath
-        codelines = programlisting.select_nodes('.//codeline')
-        for codeline_node in codelines:
-            codeline = codeline_node.node()
-            if codeline:
-                line_parts = []
-                # Find all highlight elements in this codeline
-                highlights = codeline.select_nodes('.//highlight')
-                for highlight_node in highlights:
-                    highlight = highlight_node.node()
-                    if highlight:
-                        text_content = highlight.text()
-                        if text_content:
-                            line_parts.append(text_content)
-                if line_parts:
-                    code_lines.append(''.join(line_parts))
+        # Find all codeline elements
+        for codeline in programlisting.iter('codeline'):
+            line_parts = []
+            # Find all highlight elements in this codeline
+            for highlight in codeline.iter('highlight'):
+                text = highlight.text
+                if text:
+                    line_parts.append(text)
+            if line_parts:
+                code_lines.append(''.join(line_parts))
         
         if code_lines:
             return f'```cpp\n' + '\n'.join(code_lines) + '\n```'
         return ''
     
-    def _render_class_members(self, compound: pygixml.XMLNode) -> List[str]:
+    def _render_computeroutput(self, element: pygixml.StreamElement) -> str:
+        return f'`{self._get_element_text(element)}`'
+    
+    def _render_bold(self, element: pygixml.StreamElement) -> str:
+        return f'**{self._get_element_text(element)}**'
+    
+    def _render_emphasis(self, element: pygixml.StreamElement) -> str:
+        return f'*{self._get_element_text(element)}*'
+    
+    def _render_ulink(self, element: pygixml.StreamElement) -> str:
+        return f'[{self._get_element_text(element)}]({element.get("url", "")})'
+    
+    def _render_ref(self, element: pygixml.StreamElement) -> str:
+        return f'[{self._get_element_text(element)}](./{element.get("refid", "")})'
+    
+    def _render_programlisting(self, element: pygixml.StreamElement) -> str:
+        return f'\n{self._render_code_block(element)}\n'
+    
+    # Inline paragraph children by tag, looked up once per child instead of an if/elif chain
+    _INLINE_HANDLERS: ClassVar[Dict[str, Callable[..., str]]] = {
+        'computeroutput': _render_computeroutput,
+        'bold': _render_bold,
+        'emphasis': _render_emphasis,
+        'ulink': _render_ulink,
+        'ref': _render_ref,
+        'programlisting': _render_programlisting,
+    }
+    
+    def _render_class_members(self, compound: pygixml.StreamElement, out: IO[str]) -> None:
         """Render class/struct members to MDX"""
-        lines = []
-        
-        sections = [
-            ('public-attrib', 'Public Attributes'),
-            ('public-func', 'Public Methods'),
-            ('protected-attrib', 'Protected Attributes'),
-            ('protected-func', 'Protected Methods'),
-            ('private-attrib', 'Private Attributes'),
-            ('private-func', 'Private Methods'),
-        ]
-        
-        for section_id, section_title in sections:
-            # Find sectiondef elements with the specific kind
-            sectiondefs = compound.select_nodes(f"sectiondef[@kind='{section_id}']")
-            members = []
-            for sectiondef in sectiondefs:
-                members.extend(sectiondef.select_nodes('memberdef'))
-            
+        # Bucket members by section kind in a single pass over the sectiondefs
+        buckets = {section_id: [] for section_id, _ in CLASS_SECTIONS}
+        for sectiondef in compound.findall('sectiondef'):
+            bucket = buckets.get(sectiondef.get('kind'))
+            if bucket is not None:
+                bucket.extend(sectiondef.findall('memberdef'))
+        
+        render_member = self._render_member
+        write = out.write
+        for section_id, section_title in CLASS_SECTIONS:
+            members = buckets[section_id]
             if members:
-                lines.extend([
-                    f'## {section_title}',
-                    ''
-                ])
+                write(f'## {section_title}\n\n')
                 
                 for member in members:
-                    lines.extend(self._render_member(member))
-                    lines.append('')
-        
-        return lines
+                    render_member(member, out)
+                    write('\n')
     
-    def _render_namespace_members(self, compound: pygixml.XMLNode) -> List[str]:
+    def _render_namespace_members(self, compound: pygixml.StreamElement, out: IO[str]) -> None:
         """Render namespace members to MDX"""
-        lines = []
+        # Collect the members of every sectiondef, skipping ids seen already
+        members = []
+        seen = set()
+        for sectiondef in compound.findall('sectiondef'):
+            for member in sectiondef.findall('memberdef'):
+                member_id = member.get('id')
+                if member_id:
+                    if member_id in seen:
+                        continue
+                    seen.add(member_id)
+                members.append(member)
         
-        # Find all member definitions in the namespace
-        members = compound.select_nodes('.//memberdef')
         if members:
-            lines.extend([
-                '## Members',
-                ''
-            ])
+            out.write('## Members\n\n')
             
+            render_member = self._render_member
+            write = out.write
             for member in members:
-                lines.extend(self._render_member(member))
-                lines.append('')
-        
-        return lines
+                render_member(member, out)
+                write('\n')
     
-    def _render_file_contents(self, compound: pygixml.XMLNode) -> List[str]:
+    def _render_file_contents(self, compound: pygixml.StreamElement, out: IO[str]) -> None:
         """Render file contents to MDX"""
-        lines = []
-        
         # Add includes
-        includes = compound.select_nodes('.//includes')
+        includes = list(compound.iter('includes'))
         if includes:
-            lines.extend([
-                '## Includes',
-                ''
-            ])
+            out.write('## Includes\n\n')
             for inc in includes:
-                text_content = inc.text()
-                if text_content:
-                    lines.append(f'- `{text_content}`')
-            lines.append('')
+                text = inc.text
+                if text:
+                    out.write(f'- `{text}`\n')
+            out.write('\n')
         
         # Add defined classes/structs
-        innergroups = compound.select_nodes('.//innergroup')
+        innergroups = list(compound.iter('innergroup'))
         if innergroups:
-            lines.extend([
-                '## Defined Classes',
-                ''
-            ])
+            out.write('## Defined Classes\n\n')
             for group in innergroups:
-                refid = group.attribute('refid') or ''
+                refid = group.get('refid', '')
                 name = self._get_element_text(group)
-                lines.append(f'- [{name}](./{refid})')
-            lines.append('')
-        
-        return lines
+                out.write(f'- [{name}](./{refid})\n')
+            out.write('\n')
     
-    def _render_member(self, member: pygixml.XMLNode) -> List[str]:
+    def _render_member(self, member: pygixml.StreamElement, out: IO[str]) -> None:
         """Render a single member (function, variable, etc.) to MDX"""
-        lines = []
-        
-        member_kind = member.attribute('kind') or ''
-        member_name = member.child('name')
-        if not member_name or not member_name.child_value():
-            return lines
-        
-        name = member_name.child_value()
+        member_kind = member.get('kind', '')
+        
+        # Collect the children we need in one pass over the member
+        name_node = args_node = brief_node = detailed_node = type_node = None
+        params = []
+        for child in member:
+            tag = child.tag
+            if tag == 'name':
+                name_node = child
+            elif tag == 'argsstring':
+                args_node = child
+            elif tag == 'briefdescription':
+                brief_node = child
+            elif tag == 'detaileddescription':
+                detailed_node = child
+            elif tag == 'type':
+                type_node = child
+            elif tag == 'param':
+                params.append(child)
+        
+        name = name_node.text if name_node is not None else None
+        if not name:
+            return
         
         # Create header based on member kind
         if member_kind == 'function':
             # Get function signature
-            argsstring = member.child('argsstring')
-            signature = f'{name}{argsstring.child_value() if argsstring else "()"}'
-            lines.append(f'### `{signature}`')
+            args = args_node.text if args_node is not None else None
+            signature = f'{name}{args or "()"}'
+            out.write(f'### `{signature}`\n\n')
         else:
             # Variable or other member
-            lines.append(f'### `{name}`')
-        
-        lines.append('')
+            out.write(f'### `{name}`\n\n')
         
         # Add brief description
-        brief_desc = member.child('briefdescription')
-        if brief_desc:
-            brief_text = self._render_description(brief_desc)
-            if brief_text:
-                lines.append(brief_text)
-                lines.append('')
+        if brief_node is not None:
+            self._render_description(brief_node, out)
         
         # Add detailed description
-        detailed_desc = member.child('detaileddescription')
-        if detailed_desc:
-            detailed_text = self._render_description(detailed_desc)
-            if detailed_text:
-                lines.append(detailed_text)
-                lines.append('')
+        if detailed_node is not None:
+            self._render_description(detailed_node, out)
         
-        # Add parameters for functions
         if member_kind == 'function':
-            params = member.select_nodes('.//param')
+            # Add parameters (direct children only, so template parameters are not picked up)
             if params:
-                lines.extend([
-                    '#### Parameters',
-                    ''
-                ])
+                out.write(_PARAMS_HEADER)
                 for param in params:
-                    param_name = param.child('declname')
-                    param_desc = param.child('defval')
-                    if param_name and param_name.child_value():
-                        param_line = f'- `{param_name.child_value()}`'
-                        if param_desc and param_desc.child_value():
-                            param_line += f': {param_desc.child_value()}'
-                        lines.append(param_line)
-                lines.append('')
-        
-        # Add return value for functions
-        if member_kind == 'function':
-            returns = member.child('type')
-            if returns and returns.child_value():
-                lines.extend([
-                    '#### Returns',
-                    '',
-                    f'`{returns.child_value().strip()}`',
-                    ''
-                ])
-        
-        return lines
+                    declname_node = param.find('declname')
+                    param_name = declname_node.text if declname_node is not None else None
+                    if param_name:
+                        param_line = f'- `{param_name}`'
+                        defval_node = param.find('defval')
+                        param_desc = defval_node.text if defval_node is not None else None
+                        if param_desc:
+                            param_line += f': {param_desc}'
+                        out.write(param_line + '\n')
+                out.write('\n')
+            
+            # Add return value
+            return_type = type_node.text if type_node is not None else None
+            if return_type:
+                out.write(f'{_RETURNS_HEADER}`{return_type.strip()}`\n\n')
     
-    def _get_element_text(self, element: pygixml.XMLNode) -> str:
+    def _get_element_text(self, element: pygixml.StreamElement) -> str:
         """Extract text content from an element and its children"""
-        return element.text() or ''
+        text = element.text or ''
+        for child in element:
+            text += self._get_element_text(child)
+            tail = child.tail
+            if tail:
+                text += tail
+        return text.strip()
     
-    def _wrap_unknown_element(self, element: pygixml.XMLNode) -> str:
+    def _wrap_unknown_element(self, element: pygixml.StreamElement) -> str:
         """Wrap unknown XML elements in div with doxygen- class"""
         element_text = self._get_element_text(element)
         if element_text:
-            return f'<div class="doxygen-{element.name}">{element_text}</div>'
+            return f'<div class="doxygen-{element.tag}">{element_text}</div>'
         return ''
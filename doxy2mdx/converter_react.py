@@ -1,311 +1,281 @@
-import os
-import xml.etree.ElementTree as ET
-from pathlib import Path
-from typing import Dict, List, Optional, Any
 import re
+from typing import IO, Callable, ClassVar, Dict, Iterator
 
+from .converter_react_base import _DoxygenRendererBase
+from .utils import ET, escape_jsx, parse_compounddef
 
-class DoxygenToReactConverter:
-    def __init__(self, config: Dict[str, Any]):
-        self.config = config
-        self.heading_offset = config.get('heading_offset', 0)
-        self.project_name = config.get('project_name', 'Project')
-        
-    def convert_directory(self, input_dir: str, output_dir: str):
-        """Convert all XML files in input directory to React component files in output directory"""
-        input_path = Path(input_dir)
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        for xml_file in input_path.glob("*.xml"):
-            if xml_file.name.startswith("index"):
-                continue
-                
-            react_content = self.convert_file(str(xml_file))
-            if react_content:
-                output_file = output_path / f"{xml_file.stem}.jsx"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(react_content)
-                print(f"Converted: {xml_file.name} -> {output_file.name}")
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+# Same mapping as _NON_ALNUM_RE for ASCII input, applied as a single C-level str.translate
+_ASCII_NON_ALNUM_TO_SPACE = str.maketrans({chr(c): ' ' for c in range(128) if not chr(c).isalnum()})
+
+
+# JSX templates for a single member definition; optional blocks are pre-rendered to '' when absent.
+# They are f-string functions because str.format re-parses its template on every call,
+# which made these templates about 4x slower.
+def _member_template(member_id: str, name: str, signature: str, brief: str, detailed: str,
+                     params: str, returns: str, memitem_end: str) -> str:
+    return (
+        '      <div className="doxygen-member-definition">\n'
+        '        <h3 className="doxygen-memtitle">\n'
+        '          <span className="doxygen-permalink">\n'
+        f'            <a href="#{member_id}">◆&nbsp;</a>\n'
+        '          </span>\n'
+        f'          {name}\n'
+        '        </h3>\n'
+        f'{signature}'
+        '          <div className="doxygen-memdoc">\n'
+        f'{brief}'
+        f'{detailed}'
+        f'{params}'
+        f'{returns}'
+        '          </div>\n'
+        f'{memitem_end}'
+        '      </div>\n'
+    )
+
+
+def _signature_template(signature: str) -> str:
+    return (
+        '        <div className="doxygen-memitem">\n'
+        '          <div className="doxygen-memproto">\n'
+        '            <table className="doxygen-memname">\n'
+        '              <tbody>\n'
+        '                <tr>\n'
+        f'                  <td className="doxygen-memname">{signature}</td>\n'
+        '                </tr>\n'
+        '              </tbody>\n'
+        '            </table>\n'
+        '          </div>\n'
+    )
+
+
+def _brief_template(text: str) -> str:
+    return f'            <p className="doxygen-briefdescription">{text}</p>\n'
+
+
+def _detailed_template(text: str) -> str:
+    return f'            <div className="doxygen-detaileddescription">{text}</div>\n'
+
+
+def _params_template(rows: str) -> str:
+    return (
+        '            <dl className="doxygen-params">\n'
+        '              <dt>Parameters</dt>\n'
+        '              <dd>\n'
+        '                <table className="doxygen-params">\n'
+        '                  <tbody>\n'
+        f'{rows}'
+        '                  </tbody>\n'
+        '                </table>\n'
+        '              </dd>\n'
+        '            </dl>\n'
+    )
+
+
+def _param_row_template(name: str, description: str) -> str:
+    return (
+        '                    <tr>\n'
+        f'                      <td className="doxygen-paramname">{name}</td>\n'
+        f'                      <td>{description}</td>\n'
+        '                    </tr>\n'
+    )
+
+
+def _returns_template(return_type: str) -> str:
+    return (
+        '            <dl className="doxygen-section-return">\n'
+        '              <dt>Returns</dt>\n'
+        f'              <dd><code>{return_type}</code></dd>\n'
+        '            </dl>\n'
+    )
+
+
+def _pascal_case(compound_id: str) -> str:
+    """Convert a compound id to a PascalCase identifier"""
+    if compound_id.isascii():
+        words = compound_id.translate(_ASCII_NON_ALNUM_TO_SPACE).split()
+    else:
+        words = _NON_ALNUM_RE.sub(' ', compound_id).split()
+    return ''.join(word.capitalize() for word in words)
+
+
+class DoxygenToReactConverter(_DoxygenRendererBase):
+    _OUTPUT_SUFFIX = '.jsx'
     
-    def convert_file(self, xml_file: str) -> Optional[str]:
-        """Convert a single XML file to React component content"""
+    def convert_file_to(self, xml_file: str, out: IO[str]) -> bool:
+        """Convert a single XML file, writing the React component to out"""
         try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            
-            # Get compound definition
-            compound = root.find('compounddef')
+            compound = parse_compounddef(xml_file)
             if compound is None:
-                return None
+                return False
                 
-            compound_id = compound.get('id', '')
             compound_kind = compound.get('kind', '')
             
-            # Start building React component
+            # Start writing React component
             component_name = self._get_component_name(compound)
             
-            react_lines = [
-                'import React from \'react\';',
-                '',
-                f'const {component_name} = () => {{',
-                '  return (',
-                '    <div className="doxygen-component">'
-            ]
+            out.write(
+                'import React from \'react\';\n'
+                '\n'
+                f'const {component_name} = () => {{\n'
+                '  return (\n'
+                '    <div className="doxygen-component">\n'
+            )
             
             # Add compound description
             brief_desc = compound.find('briefdescription')
             if brief_desc is not None:
-                brief_text = self._render_description(brief_desc)
+                brief_text = escape_jsx(self._render_description(brief_desc))
                 if brief_text:
-                    react_lines.append(f'      <p className="doxygen-briefdescription">{brief_text}</p>')
+                    out.write(f'      <p className="doxygen-briefdescription">{brief_text}</p>\n')
             
             # Add detailed description
             detailed_desc = compound.find('detaileddescription')
             if detailed_desc is not None:
-                detailed_text = self._render_description(detailed_desc)
+                detailed_text = escape_jsx(self._render_description(detailed_desc))
                 if detailed_text:
-                    react_lines.append(f'      <div className="doxygen-detaileddescription">{detailed_text}</div>')
+                    out.write(f'      <div className="doxygen-detaileddescription">{detailed_text}</div>\n')
             
             # Add sections based on compound kind
-            if compound_kind in ['class', 'struct']:
-                react_lines.extend(self._render_class_members_react(compound))
-            elif compound_kind == 'namespace':
-                react_lines.extend(self._render_namespace_members_react(compound))
-            elif compound_kind == 'file':
-                react_lines.extend(self._render_file_contents_react(compound))
+            renderer = self._KIND_RENDERERS.get(compound_kind)
+            if renderer is not None:
+                out.writelines(renderer(self, compound))
+            
+            out.write(
+                '    </div>\n'
+                '  );\n'
+                '};\n'
+                '\n'
+                f'export default {component_name};\n'
+            )
             
-            react_lines.extend([
-                '    </div>',
-                '  );',
-                '};',
-                '',
-                f'export default {component_name};',
-                ''
-            ])
+            compound.clear()
             
-            return '\n'.join(react_lines)
+            return True
             
         except Exception as e:
             print(f"Error parsing XML file {xml_file}: {e}")
-            return None
+            return False
     
     def _get_component_name(self, compound: ET.Element) -> str:
         """Generate React component name from compound"""
         compound_id = compound.get('id', '')
         if compound_id:
-            # Convert compound_id to PascalCase
-            name = re.sub(r'[^a-zA-Z0-9]', ' ', compound_id)
-            name = ''.join(word.capitalize() for word in name.split())
-            return name
+            return _pascal_case(compound_id)
         return 'DoxygenComponent'
     
-    def _render_description(self, description: ET.Element) -> str:
-        """Render a description element to text"""
-        paragraphs = []
-        
-        # Find all para elements
-        for para in description.findall('.//para'):
-            para_text = self._render_paragraph_text(para)
-            if para_text:
-                paragraphs.append(para_text)
-        
-        return ' '.join(paragraphs)
-    
-    def _render_paragraph_text(self, para: ET.Element) -> str:
-        """Render a paragraph element to plain text"""
-        text_parts = []
-        
-        # Get text content
-        if para.text:
-            text_parts.append(para.text.strip())
-        
-        # Handle child elements
-        for child in para:
-            if child.tag in ['computeroutput', 'bold', 'emphasis']:
-                text_parts.append(self._get_element_text(child))
-            elif child.tag == 'ulink':
-                text_parts.append(self._get_element_text(child))
-            elif child.tag == 'ref':
-                text_parts.append(self._get_element_text(child))
-            else:
-                text_parts.append(self._get_element_text(child))
-            
-            # Add tail text
-            if child.tail:
-                text_parts.append(child.tail.strip())
-        
-        result = ' '.join(text_parts).strip()
-        return result if result else ''
-    
-    def _render_class_members_react(self, compound: ET.Element) -> List[str]:
+    def _render_class_members_react(self, compound: ET.Element) -> Iterator[str]:
         """Render class/struct members to React JSX"""
-        lines = []
-        
-        sections = [
-            ('public-attrib', 'Public Attributes'),
-            ('public-func', 'Public Methods'),
-            ('protected-attrib', 'Protected Attributes'),
-            ('protected-func', 'Protected Methods'),
-            ('private-attrib', 'Private Attributes'),
-            ('private-func', 'Private Methods'),
-        ]
-        
-        for section_id, section_title in sections:
-            members = []
-            for sectiondef in compound.findall(f"sectiondef[@kind='{section_id}']"):
-                members.extend(sectiondef.findall('memberdef'))
+        render_member = self._render_member_react
+        for section_title, members in self._iter_class_sections(compound):
+            yield f'      <h2 className="doxygen-section-title">{section_title}</h2>\n'
             
-            if members:
-                lines.append(f'      <h2 className="doxygen-section-title">{section_title}</h2>')
-                
-                for member in members:
-                    lines.extend(self._render_member_react(member))
-        
-        return lines
+            for member in members:
+                yield from render_member(member)
     
-    def _render_namespace_members_react(self, compound: ET.Element) -> List[str]:
+    def _render_namespace_members_react(self, compound: ET.Element) -> Iterator[str]:
         """Render namespace members to React JSX"""
-        lines = []
-        
         # Find all member definitions in the namespace
-        members = compound.findall('.//memberdef')
+        members = self._XP_MEMBERDEF(compound)
         if members:
-            lines.append('      <h2 className="doxygen-section-title">Members</h2>')
+            yield '      <h2 className="doxygen-section-title">Members</h2>\n'
             
             for member in members:
-                lines.extend(self._render_member_react(member))
-        
-        return lines
+                yield from self._render_member_react(member)
     
-    def _render_file_contents_react(self, compound: ET.Element) -> List[str]:
+    def _render_file_contents_react(self, compound: ET.Element) -> Iterator[str]:
         """Render file contents to React JSX"""
-        lines = []
-        
         # Add includes
-        includes = compound.findall('.//includes')
+        includes = self._XP_INCLUDES(compound)
         if includes:
-            lines.append('      <h2 className="doxygen-section-title">Includes</h2>')
-            lines.append('      <ul className="doxygen-includes">')
+            yield '      <h2 className="doxygen-section-title">Includes</h2>\n'
+            yield '      <ul className="doxygen-includes">\n'
             for inc in includes:
                 if inc.text:
-                    lines.append(f'        <li><code>{inc.text}</code></li>')
-            lines.append('      </ul>')
+                    yield f'        <li><code>{escape_jsx(inc.text)}</code></li>\n'
+            yield '      </ul>\n'
         
         # Add defined classes/structs
-        innergroups = compound.findall('.//innergroup')
+        innergroups = self._XP_INNERGROUP(compound)
         if innergroups:
-            lines.append('      <h2 className="doxygen-section-title">Defined Classes</h2>')
-            lines.append('      <ul className="doxygen-innergroups">')
+            yield '      <h2 className="doxygen-section-title">Defined Classes</h2>\n'
+            yield '      <ul className="doxygen-innergroups">\n'
             for group in innergroups:
                 refid = group.get('refid', '')
                 name = self._get_element_text(group)
-                lines.append(f'        <li><a href="./{refid}">{name}</a></li>')
-            lines.append('      </ul>')
-        
-        return lines
+                yield f'        <li><a href="./{escape_jsx(refid)}">{escape_jsx(name)}</a></li>\n'
+            yield '      </ul>\n'
+    
+    # Section renderers by compound kind
+    _KIND_RENDERERS: ClassVar[Dict[str, Callable[..., Iterator[str]]]] = {
+        'class': _render_class_members_react,
+        'struct': _render_class_members_react,
+        'namespace': _render_namespace_members_react,
+        'file': _render_file_contents_react,
+    }
     
-    def _render_member_react(self, member: ET.Element) -> List[str]:
+    def _render_member_react(self, member: ET.Element) -> Iterator[str]:
         """Render a single member (function, variable, etc.) to React JSX"""
-        lines = []
-        
         member_kind = member.get('kind', '')
         member_name = member.find('name')
         if member_name is None or not member_name.text:
-            return lines
+            return
         
         name = member_name.text
-        
-        # Create member definition
-        lines.append('      <div className="doxygen-member-definition">')
-        
-        # Add title with permalink
-        member_id = member.get('id', '')
-        lines.append(f'        <h3 className="doxygen-memtitle">')
-        lines.append(f'          <span className="doxygen-permalink">')
-        lines.append(f'            <a href="#{member_id}">◆&nbsp;</a>')
-        lines.append(f'          </span>')
-        lines.append(f'          {name}')
-        lines.append(f'        </h3>')
+        is_function = member_kind == 'function'
         
         # Add signature
-        if member_kind == 'function':
+        signature_block = ''
+        if is_function:
             argsstring = member.find('argsstring')
             signature = f'{name}{argsstring.text if argsstring is not None and argsstring.text else "()"}'
-            lines.append(f'        <div className="doxygen-memitem">')
-            lines.append(f'          <div className="doxygen-memproto">')
-            lines.append(f'            <table className="doxygen-memname">')
-            lines.append(f'              <tbody>')
-            lines.append(f'                <tr>')
-            lines.append(f'                  <td className="doxygen-memname">{signature}</td>')
-            lines.append(f'                </tr>')
-            lines.append(f'              </tbody>')
-            lines.append(f'            </table>')
-            lines.append(f'          </div>')
-        
-        # Add documentation
-        lines.append('          <div className="doxygen-memdoc">')
+            signature_block = _signature_template(escape_jsx(signature))
         
         # Add brief description
+        brief_block = ''
         brief_desc = member.find('briefdescription')
         if brief_desc is not None:
             brief_text = self._render_description(brief_desc)
             if brief_text:
-                lines.append(f'            <p className="doxygen-briefdescription">{brief_text}</p>')
+                brief_block = _brief_template(escape_jsx(brief_text))
         
         # Add detailed description
+        detailed_block = ''
         detailed_desc = member.find('detaileddescription')
         if detailed_desc is not None:
             detailed_text = self._render_description(detailed_desc)
             if detailed_text:
-                lines.append(f'            <div className="doxygen-detaileddescription">{detailed_text}</div>')
+                detailed_block = _detailed_template(escape_jsx(detailed_text))
         
-        # Add parameters for functions
-        if member_kind == 'function':
-            params = member.findall('.//param')
+        params_block = ''
+        returns_block = ''
+        if is_function:
+            # Add parameters for functions
+            params = self._XP_PARAM(member)
             if params:
-                lines.append('            <dl className="doxygen-params">')
-                lines.append('              <dt>Parameters</dt>')
-                lines.append('              <dd>')
-                lines.append('                <table className="doxygen-params">')
-                lines.append('                  <tbody>')
+                # Hoist lookups out of the per-parameter loop
+                rows = []
+                append = rows.append
                 for param in params:
-                    param_name = param.find('declname')
-                    if param_name is not None and param_name.text:
-                        param_desc = param.find('defval')
-                        desc_text = param_desc.text if param_desc is not None and param_desc.text else ''
-                        lines.append(f'                    <tr>')
-                        lines.append(f'                      <td className="doxygen-paramname">{param_name.text}</td>')
-                        lines.append(f'                      <td>{desc_text}</td>')
-                        lines.append(f'                    </tr>')
-                lines.append('                  </tbody>')
-                lines.append('                </table>')
-                lines.append('              </dd>')
-                lines.append('            </dl>')
-        
-        # Add return value for functions
-        if member_kind == 'function':
+                    param_name = param.findtext('declname')
+                    if param_name:
+                        desc_text = param.findtext('defval') or ''
+                        append(_param_row_template(escape_jsx(param_name), escape_jsx(desc_text)))
+                params_block = _params_template(''.join(rows))
+            
+            # Add return value for functions
             returns = member.find('type')
             if returns is not None and returns.text:
-                lines.append('            <dl className="doxygen-section-return">')
-                lines.append('              <dt>Returns</dt>')
-                lines.append(f'              <dd><code>{returns.text.strip()}</code></dd>')
-                lines.append('            </dl>')
-        
-        lines.append('          </div>')
+                returns_block = _returns_template(escape_jsx(returns.text.strip()))
         
-        if member_kind == 'function':
-            lines.append('        </div>')
-        
-        lines.append('      </div>')
-        
-        return lines
-    
-    def _get_element_text(self, element: ET.Element) -> str:
-        """Extract text content from an element and its children"""
-        text = element.text or ''
-        for child in element:
-            text += self._get_element_text(child)
-            if child.tail:
-                text += child.tail
-        return text.strip()
+        # Emit the whole member definition in one piece
+        yield _member_template(
+            member_id=escape_jsx(member.get('id', '')),
+            name=escape_jsx(name),
+            signature=signature_block,
+            brief=brief_block,
+            detailed=detailed_block,
+            params=params_block,
+            returns=returns_block,
+            memitem_end='        </div>\n' if is_function else '',
+        )
@@ -0,0 +1,132 @@
+import io
+import os
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+from .utils import CLASS_SECTIONS, ET, compile_path, convert_worker, write_text
+
+_WS_RE = re.compile(r'\s+')
+
+
+def _is_up_to_date(output_file: str, source_mtime_ns: int) -> bool:
+    """Check whether output_file exists and is no older than its source"""
+    try:
+        return os.stat(output_file).st_mtime_ns >= source_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+class _DoxygenRendererBase(ABC):
+    """Shared file handling and text rendering for the React-based converters"""
+    # Extension of the generated files, set by each converter
+    _OUTPUT_SUFFIX = ''
+    
+    _XP_MEMBERDEF = compile_path('.//memberdef')
+    _XP_PARAM = compile_path('.//param')
+    _XP_INCLUDES = compile_path('.//includes')
+    _XP_INNERGROUP = compile_path('.//innergroup')
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.heading_offset = config.get('heading_offset', 0)
+        self.project_name = config.get('project_name', 'Project')
+    
+    def convert_directory(self, input_dir: str, output_dir: str):
+        """Convert all XML files in input directory to output files in output directory"""
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        # Enumerate with scandir so no Path object is built per entry
+        skip_prefixes = tuple(self.config.get('skip_prefixes', ('index',)))
+        with os.scandir(input_dir) as entries:
+            xml_entries = [
+                e for e in entries
+                if e.name.endswith('.xml') and not e.name.startswith(skip_prefixes) and e.is_file(follow_symlinks=False)
+            ]
+        
+        # In incremental mode, leave outputs that are at least as new as their XML alone.
+        # Only mtimes are compared, so a change of mode or options is not noticed
+        incremental = self.config.get('incremental', False)
+        xml_files = []
+        output_files = []
+        skipped = 0
+        for e in xml_entries:
+            output_file = os.path.join(output_dir, e.name[:-4] + self._OUTPUT_SUFFIX)
+            if incremental and _is_up_to_date(output_file, e.stat().st_mtime_ns):
+                skipped += 1
+                continue
+            xml_files.append(e.path)
+            output_files.append(output_file)
+        
+        if skipped:
+            print(f"Skipped {skipped} up-to-date files (run without --incremental to regenerate them)")
+        
+        # Files are independent, so parse, render and write them in parallel
+        with ProcessPoolExecutor(max_workers=self.config.get('jobs') or None) as executor:
+            results = executor.map(
+                convert_worker, repeat(type(self)), repeat(self.config), xml_files, output_files, chunksize=8
+            )
+            for xml_file, output_file, converted in zip(xml_files, output_files, results):
+                if converted:
+                    print(f"Converted: {os.path.basename(xml_file)} -> {os.path.basename(output_file)}")
+    
+    def convert_file_to_path(self, xml_file: str, output_file: str) -> bool:
+        """Convert a single XML file into output_file, leaving any previous output untouched on failure"""
+        # Render in memory, then hand the whole file to the OS in one write
+        content = self.convert_file(xml_file)
+        if content is None:
+            return False
+        write_text(output_file, content)
+        return True
+    
+    def convert_file(self, xml_file: str) -> Optional[str]:
+        """Convert a single XML file to output content"""
+        buffer = io.StringIO()
+        if self.convert_file_to(xml_file, buffer):
+            return buffer.getvalue()
+        return None
+    
+    @abstractmethod
+    def convert_file_to(self, xml_file: str, out: IO[str]) -> bool:
+        """Convert a single XML file, writing the output to out"""
+    
+    def _render_description(self, description: ET.Element) -> str:
+        """Render a description element to text"""
+        # Walk the para elements in document order, skipping empty ones
+        return ' '.join(filter(None, map(self._render_paragraph_text, description.iter('para'))))
+    
+    def _render_paragraph_text(self, para: ET.Element) -> str:
+        """Render a paragraph element to plain text"""
+        # Every inline child is flattened to its text; element boundaries are kept apart by a
+        # space so '<computeroutput>x</computeroutput>the' stays 'x the'
+        parts = [para.text or '']
+        for child in para:
+            parts.append(''.join(child.itertext()))
+            parts.append(child.tail or '')
+        
+        # Collapse runs of whitespace (including newlines) with a single regex pass
+        return _WS_RE.sub(' ', ' '.join(parts)).strip()
+    
+    def _iter_class_sections(self, compound: ET.Element) -> Iterator[Tuple[str, Iterator[ET.Element]]]:
+        """Yield (section title, members) for each non-empty class member section in display order"""
+        # Bucket sectiondefs by kind in a single pass; their members are chained lazily below
+        sectiondefs_by_kind = {}
+        for sectiondef in compound.iterfind('sectiondef'):
+            sectiondefs_by_kind.setdefault(sectiondef.get('kind'), []).append(sectiondef)
+        
+        for section_id, section_title in CLASS_SECTIONS:
+            members = chain.from_iterable(
+                sectiondef.iterfind('memberdef') for sectiondef in sectiondefs_by_kind.get(section_id, ())
+            )
+            
+            # Only report the section when it has at least one member
+            first = next(members, None)
+            if first is not None:
+                yield section_title, chain((first,), members)
+    
+    def _get_element_text(self, element: ET.Element) -> str:
+        """Extract text content from an element and its children"""
+        return ''.join(element.itertext()).strip()
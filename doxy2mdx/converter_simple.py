@@ -1,11 +1,28 @@
+import io
+import logging
 import os
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import re
+from typing import IO, Any, Callable, ClassVar, Dict, Optional
+
+from .utils import CLASS_SECTIONS, ET, SIDEBAR_PREFIX_RE, compile_path, convert_worker, parse_compounddef, write_text
+
+logger = logging.getLogger(__name__)
+
+_ELEMENT_TEXT = attrgetter('text')
 
 
 class DoxygenToMDXConverter:
+    _XP_MEMBERDEF = compile_path('.//memberdef')
+    _XP_INCLUDES = compile_path('.//includes')
+    _XP_INNERGROUP = compile_path('.//innergroup')
+    _XP_SECTION_MEMBERS: ClassVar[Dict[str, Callable[[ET.Element], Any]]] = {
+        section_id: compile_path(f"sectiondef[@kind='{section_id}']/memberdef")
+        for section_id, _ in CLASS_SECTIONS
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.heading_offset = config.get('heading_offset', 0)
@@ -17,51 +34,78 @@ class DoxygenToMDXConverter:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        for xml_file in input_path.glob("*.xml"):
-            if xml_file.name.startswith("index"):
-                continue
-                
-            mdx_content = self.convert_file(str(xml_file))
-            if mdx_content:
-                output_file = output_path / f"{xml_file.stem}.mdx"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(mdx_content)
-                print(f"Converted: {xml_file.name} -> {output_file.name}")
+        skip_prefixes = tuple(self.config.get('skip_prefixes', ('index',)))
+        xml_files = [str(p) for p in input_path.glob("*.xml") if not p.name.startswith(skip_prefixes)]
+        output_files = [str(output_path / f"{Path(xml_file).stem}.mdx") for xml_file in xml_files]
+        
+        # Files are independent and parsing is CPU-bound, so use processes rather than threads
+        with ProcessPoolExecutor(max_workers=self.config.get('jobs') or None) as executor:
+            results = executor.map(
+                convert_worker, repeat(type(self)), repeat(self.config), xml_files, output_files, chunksize=8
+            )
+            # Per-file progress is debug-level only; the summary is reported once at the end
+            converted_count = 0
+            for xml_file, output_file, converted in zip(xml_files, output_files, results):
+                if converted:
+                    converted_count += 1
+                    logger.debug("Converted: %s -> %s", Path(xml_file).name, Path(output_file).name)
+        
+        logger.info("Converted %d files", converted_count)
+    
+    def convert_file_to_path(self, xml_file: str, output_file: str) -> bool:
+        """Convert a single XML file and write the MDX to output_file, returning whether it was written"""
+        mdx_content = self.convert_file(xml_file)
+        if not mdx_content:
+            return False
+        write_text(output_file, mdx_content)
+        return True
     
     def convert_file(self, xml_file: str) -> Optional[str]:
         """Convert a single XML file to MDX content"""
+        return self._convert_source(xml_file, xml_file)
+    
+    def convert_file_from_bytes(self, data: bytes, name: str = '<bytes>') -> Optional[str]:
+        """Convert Doxygen XML already read into memory to MDX content"""
+        return self._convert_source(io.BytesIO(data), name)
+    
+    def _convert_source(self, source, name: str) -> Optional[str]:
+        """Parse a path or binary file object and convert its compounddef to MDX content"""
         try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            
-            # Get compound definition
-            compound = root.find('compounddef')
+            compound = parse_compounddef(source)
             if compound is None:
                 return None
-                
-            compound_id = compound.get('id', '')
-            compound_kind = compound.get('kind', '')
-            
-            # Start building MDX content
-            mdx_lines = []
-            
-            # Add frontmatter for Docusaurus
-            mdx_lines.extend([
-                '---',
-                f'title: {self._get_title(compound)}',
-                f'sidebar_label: {self._get_sidebar_label(compound)}',
-                '---',
-                ''
-            ])
-            
-            # Add main content
-            mdx_lines.extend(self._render_compound(compound))
-            
-            return '\n'.join(mdx_lines)
+            return self._convert_compound(compound)
             
-        except Exception as e:
-            print(f"Error parsing XML file {xml_file}: {e}")
+        except OSError as e:
+            logger.error("Error reading XML file %s: %s", name, e)
             return None
+        except Exception:
+            logger.exception("Error parsing XML file %s", name)
+            return None
+    
+    def _convert_compound(self, compound: ET.Element) -> str:
+        """Convert a parsed compounddef element to MDX content"""
+        buf = io.StringIO()
+        
+        # Add frontmatter for Docusaurus; the label is derived from the title, so look it up once
+        title = self._get_title(compound)
+        buf.write(
+            '---\n'
+            f'title: {title}\n'
+            f'sidebar_label: {self._get_sidebar_label(title)}\n'
+            '---\n'
+            '\n'
+        )
+        
+        # Add main content
+        self._render_compound(compound, buf)
+        
+        # Release the compound subtree once it has been rendered
+        compound.clear()
+        
+        # Every line is written with its newline; drop the last one so the output
+        # matches the previous newline-joined lines exactly
+        return buf.getvalue()[:-1]
     
     def _get_title(self, compound: ET.Element) -> str:
         """Extract title from compound element"""
@@ -72,52 +116,47 @@ class DoxygenToMDXConverter:
         # Fallback to compound name
         compound_id = compound.get('id', '')
         if compound_id:
-            return str(compound_id).replace('_', ' ').title()
+            return compound_id.replace('_', ' ').title()
         return 'Untitled'
     
-    def _get_sidebar_label(self, compound: ET.Element) -> str:
-        """Generate sidebar label from compound"""
-        title = self._get_title(compound)
+    def _get_sidebar_label(self, title: str) -> str:
+        """Generate sidebar label from a compound title"""
         # Remove common prefixes and make it shorter
-        label = re.sub(r'^(class|struct|namespace|file)\s+', '', title)
+        label = SIDEBAR_PREFIX_RE.sub('', title)
         return label
     
-    def _render_compound(self, compound: ET.Element) -> List[str]:
-        """Render a compound definition to MDX lines"""
-        lines = []
-        
-        # Add compound description
-        brief_desc = compound.find('briefdescription')
-        if brief_desc is not None:
-            brief_text = self._render_description(brief_desc)
-            if brief_text:
-                lines.extend([brief_text, ''])
-        
-        # Add detailed description
-        detailed_desc = compound.find('detaileddescription')
-        if detailed_desc is not None:
-            detailed_text = self._render_description(detailed_desc)
-            if detailed_text:
-                lines.extend([detailed_text, ''])
+    def _render_compound(self, compound: ET.Element, buf: IO[str]) -> None:
+        """Render a compound definition as MDX lines written to buf"""
+        # Add compound descriptions
+        self._write_descriptions(compound.find('briefdescription'), compound.find('detaileddescription'), buf)
         
         # Add sections based on compound kind
         compound_kind = compound.get('kind', '')
         
         if compound_kind in ['class', 'struct']:
-            lines.extend(self._render_class_members(compound))
+            self._render_class_members(compound, buf)
         elif compound_kind == 'namespace':
-            lines.extend(self._render_namespace_members(compound))
+            self._render_namespace_members(compound, buf)
         elif compound_kind == 'file':
-            lines.extend(self._render_file_contents(compound))
-        
-        return lines
+            self._render_file_contents(compound, buf)
+    
+    def _write_descriptions(
+        self, brief_desc: Optional[ET.Element], detailed_desc: Optional[ET.Element], buf: IO[str]
+    ) -> None:
+        """Write the brief and detailed descriptions to buf, skipping missing or empty ones"""
+        for description in (brief_desc, detailed_desc):
+            if description is not None:
+                text = self._render_description(description)
+                if text:
+                    buf.write(text)
+                    buf.write('\n\n')
     
     def _render_description(self, description: ET.Element) -> str:
         """Render a description element to markdown"""
         paragraphs = []
         
         # Find all para elements
-        for para in description.findall('.//para'):
+        for para in description.iter('para'):
             para_text = self._render_paragraph(para)
             if para_text:
                 paragraphs.append(para_text)
@@ -126,184 +165,193 @@ class DoxygenToMDXConverter:
     
     def _render_paragraph(self, para: ET.Element) -> str:
         """Render a paragraph element to markdown"""
-        text_parts = []
+        # Text-only paragraphs (most brief descriptions) need no inline dispatch
+        if len(para) == 0:
+            return (para.text or '').strip()
+        
+        buf = io.StringIO()
+        write = buf.write
+        get_handler = self._INLINE_HANDLERS.get
+        wrap_unknown = self._wrap_unknown_element
+        
+        # Tokens are separated by a single space, exactly as the former ' '.join did
+        needs_space = False
         
         # Get text content
         if para.text:
-            text_parts.append(para.text.strip())
+            write(para.text.strip())
+            needs_space = True
         
         # Handle child elements
         for child in para:
-            if child.tag == 'computeroutput':
-                text_parts.append(f'`{self._get_element_text(child)}`')
-            elif child.tag == 'bold':
-                text_parts.append(f'**{self._get_element_text(child)}**')
-            elif child.tag == 'emphasis':
-                text_parts.append(f'*{self._get_element_text(child)}*')
-            elif child.tag == 'ulink':
-                url = child.get('url', '')
-                text_parts.append(f'[{self._get_element_text(child)}]({url})')
-            elif child.tag == 'ref':
-                refid = child.get('refid', '')
-                text_parts.append(f'[{self._get_element_text(child)}](./{refid})')
-            elif child.tag == 'programlisting':
-                code = self._render_code_block(child)
-                text_parts.append(f'\n{code}\n')
+            if needs_space:
+                write(' ')
+            needs_space = True
+            
+            handler = get_handler(child.tag)
+            if handler:
+                handler(self, child, write)
             else:
                 # Fallback to div for unknown elements
-                text_parts.append(self._wrap_unknown_element(child))
+                write(wrap_unknown(child))
             
             # Add tail text
             if child.tail:
-                text_parts.append(child.tail.strip())
+                write(' ')
+                write(child.tail.strip())
         
-        result = ' '.join(text_parts).strip()
-        return result if result else ''
+        return buf.getvalue().strip()
     
     def _render_code_block(self, programlisting: ET.Element) -> str:
         """Render a code block to markdown"""
-        code_lines = []
-        
-        # Find all codeline elements
-        for codeline in programlisting.findall('.//codeline'):
-            line_parts = []
-            # Find all highlight elements in this codeline
-            for highlight in codeline.findall('.//highlight'):
-                if highlight.text:
-                    line_parts.append(highlight.text)
-            if line_parts:
-                code_lines.append(''.join(line_parts))
+        # Join each codeline's highlight texts in C and drop lines that end up empty;
+        # only the highlight text itself is kept, so tails and <sp/> children stay out as before
+        code_lines = [
+            line for line in (
+                ''.join(filter(None, map(_ELEMENT_TEXT, codeline.iter('highlight'))))
+                for codeline in programlisting.iter('codeline')
+            ) if line
+        ]
         
         if code_lines:
             return f'```cpp\n' + '\n'.join(code_lines) + '\n```'
         return ''
     
-    def _render_class_members(self, compound: ET.Element) -> List[str]:
+    def _write_computeroutput(self, element: ET.Element, write: Callable[[str], Any]) -> None:
+        write('`')
+        write(self._get_element_text(element))
+        write('`')
+    
+    def _write_bold(self, element: ET.Element, write: Callable[[str], Any]) -> None:
+        write('**')
+        write(self._get_element_text(element))
+        write('**')
+    
+    def _write_emphasis(self, element: ET.Element, write: Callable[[str], Any]) -> None:
+        write('*')
+        write(self._get_element_text(element))
+        write('*')
+    
+    def _write_ulink(self, element: ET.Element, write: Callable[[str], Any]) -> None:
+        write('[')
+        write(self._get_element_text(element))
+        write('](')
+        write(element.get('url', ''))
+        write(')')
+    
+    def _write_ref(self, element: ET.Element, write: Callable[[str], Any]) -> None:
+        write('[')
+        write(self._get_element_text(element))
+        write('](./')
+        write(element.get('refid', ''))
+        write(')')
+    
+    def _write_programlisting(self, element: ET.Element, write: Callable[[str], Any]) -> None:
+        write('\n')
+        write(self._render_code_block(element))
+        write('\n')
+    
+    # Inline paragraph children by tag, looked up once per child instead of an if/elif chain
+    _INLINE_HANDLERS: ClassVar[Dict[str, Callable[..., None]]] = {
+        'computeroutput': _write_computeroutput,
+        'bold': _write_bold,
+        'emphasis': _write_emphasis,
+        'ulink': _write_ulink,
+        'ref': _write_ref,
+        'programlisting': _write_programlisting,
+    }
+    
+    def _render_class_members(self, compound: ET.Element, buf: IO[str]) -> None:
         """Render class/struct members to MDX"""
-        lines = []
-        
-        sections = [
-            ('public-attrib', 'Public Attributes'),
-            ('public-func', 'Public Methods'),
-            ('protected-attrib', 'Protected Attributes'),
-            ('protected-func', 'Protected Methods'),
-            ('private-attrib', 'Private Attributes'),
-            ('private-func', 'Private Methods'),
-        ]
-        
-        for section_id, section_title in sections:
-            members = []
-            for sectiondef in compound.findall(f"sectiondef[@kind='{section_id}']"):
-                members.extend(sectiondef.findall('memberdef'))
+        # Hoist the bound methods out of the per-member loop
+        render_member = self._render_member
+        write = buf.write
+        for section_id, section_title in CLASS_SECTIONS:
+            members = self._XP_SECTION_MEMBERS[section_id](compound)
             
             if members:
-                lines.extend([
-                    f'## {section_title}',
-                    ''
-                ])
+                write(f'## {section_title}\n\n')
                 
                 for member in members:
-                    lines.extend(self._render_member(member))
-                    lines.append('')
-        
-        return lines
+                    render_member(member, buf)
+                    write('\n')
     
-    def _render_namespace_members(self, compound: ET.Element) -> List[str]:
+    def _render_namespace_members(self, compound: ET.Element, buf: IO[str]) -> None:
         """Render namespace members to MDX"""
-        lines = []
-        
         # Find all member definitions in the namespace
-        members = compound.findall('.//memberdef')
+        members = self._XP_MEMBERDEF(compound)
         if members:
-            lines.extend([
-                '## Members',
-                ''
-            ])
+            buf.write('## Members\n\n')
             
+            render_member = self._render_member
+            write = buf.write
             for member in members:
-                lines.extend(self._render_member(member))
-                lines.append('')
-        
-        return lines
+                render_member(member, buf)
+                write('\n')
     
-    def _render_file_contents(self, compound: ET.Element) -> List[str]:
+    def _render_file_contents(self, compound: ET.Element, buf: IO[str]) -> None:
         """Render file contents to MDX"""
-        lines = []
-        
         # Add includes
-        includes = compound.findall('.//includes')
+        includes = self._XP_INCLUDES(compound)
         if includes:
-            lines.extend([
-                '## Includes',
-                ''
-            ])
-            for inc in includes:
-                if inc.text:
-                    lines.append(f'- `{inc.text}`')
-            lines.append('')
+            # Build the whole list in one join rather than a write per item
+            buf.write('## Includes\n\n')
+            buf.write(''.join([f'- `{inc.text}`\n' for inc in includes if inc.text]))
+            buf.write('\n')
         
         # Add defined classes/structs
-        innergroups = compound.findall('.//innergroup')
+        innergroups = self._XP_INNERGROUP(compound)
         if innergroups:
-            lines.extend([
-                '## Defined Classes',
-                ''
-            ])
+            buf.write('## Defined Classes\n\n')
             for group in innergroups:
                 refid = group.get('refid', '')
                 name = self._get_element_text(group)
-                lines.append(f'- [{name}](./{refid})')
-            lines.append('')
-        
-        return lines
+                buf.write(f'- [{name}](./{refid})\n')
+            buf.write('\n')
     
-    def _render_member(self, member: ET.Element) -> List[str]:
+    def _render_member(self, member: ET.Element, buf: IO[str]) -> None:
         """Render a single member (function, variable, etc.) to MDX"""
-        lines = []
-        
         member_kind = member.get('kind', '')
-        member_name = member.find('name')
+        
+        # Collect the children we need in one pass instead of a find() scan per child
+        member_name = argsstring = brief_desc = detailed_desc = returns = None
+        params = []
+        for child in member:
+            tag = child.tag
+            if tag == 'name':
+                member_name = child
+            elif tag == 'argsstring':
+                argsstring = child
+            elif tag == 'briefdescription':
+                brief_desc = child
+            elif tag == 'detaileddescription':
+                detailed_desc = child
+            elif tag == 'type':
+                returns = child
+            elif tag == 'param':
+                params.append(child)
+        
         if member_name is None or not member_name.text:
-            return lines
+            return
         
         name = member_name.text
         
         # Create header based on member kind
         if member_kind == 'function':
             # Get function signature
-            argsstring = member.find('argsstring')
             signature = f'{name}{argsstring.text if argsstring is not None and argsstring.text else "()"}'
-            lines.append(f'### `{signature}`')
+            buf.write(f'### `{signature}`\n\n')
         else:
             # Variable or other member
-            lines.append(f'### `{name}`')
-        
-        lines.append('')
-        
-        # Add brief description
-        brief_desc = member.find('briefdescription')
-        if brief_desc is not None:
-            brief_text = self._render_description(brief_desc)
-            if brief_text:
-                lines.append(brief_text)
-                lines.append('')
+            buf.write(f'### `{name}`\n\n')
         
-        # Add detailed description
-        detailed_desc = member.find('detaileddescription')
-        if detailed_desc is not None:
-            detailed_text = self._render_description(detailed_desc)
-            if detailed_text:
-                lines.append(detailed_text)
-                lines.append('')
+        # Add descriptions
+        self._write_descriptions(brief_desc, detailed_desc, buf)
         
-        # Add parameters for functions
         if member_kind == 'function':
-            params = member.findall('.//param')
+            # Add parameters (direct children only, so template parameters are not picked up)
             if params:
-                lines.extend([
-                    '#### Parameters',
-                    ''
-                ])
+                buf.write('#### Parameters\n\n')
                 for param in params:
                     param_name = param.find('declname')
                     param_desc = param.find('defval')
@@ -311,33 +359,21 @@ class DoxygenToMDXConverter:
                         param_line = f'- `{param_name.text}`'
                         if param_desc is not None and param_desc.text:
                             param_line += f': {param_desc.text}'
-                        lines.append(param_line)
-                lines.append('')
-        
-        # Add return value for functions
-        if member_kind == 'function':
-            returns = member.find('type')
+                        buf.write(f'{param_line}\n')
+                buf.write('\n')
+            
+            # Add return value
             if returns is not None and returns.text:
-                lines.extend([
-                    '#### Returns',
-                    '',
-                    f'`{returns.text.strip()}`',
-                    ''
-                ])
-        
-        return lines
+                buf.write(f'#### Returns\n\n`{returns.text.strip()}`\n\n')
     
     def _get_element_text(self, element: ET.Element) -> str:
         """Extract text content from an element and its children"""
-        text = element.text or ''
-        for child in element:
-            text += self._get_element_text(child)
-            if child.tail:
-                text += child.tail
-        return text.strip()
+        # itertext walks the subtree in C; one join replaces the recursive concatenation
+        return ''.join(element.itertext()).strip()
     
     def _wrap_unknown_element(self, element: ET.Element) -> str:
         """Wrap unknown XML elements in div with doxygen- class"""
         element_text = self._get_element_text(element)
         if element_text:
             return f'<div class="doxygen-{element.tag}">{element_text}</div>'
+        return ''
@@ -0,0 +1,117 @@
+import io
+
+from doxy2mdx import utils
+from doxy2mdx.converter import DoxygenToMDXConverter
+
+FILE_XML = """<?xml version='1.0' encoding='UTF-8' standalone='no'?>
+<doxygen version="1.9.1">
+  <compounddef id="bar_8hpp" kind="file" language="C++">
+    <compoundname>bar.hpp</compoundname>
+    <includes local="no">string</includes>
+    <briefdescription><para>Bar header.</para></briefdescription>
+    <detaileddescription></detaileddescription>
+  </compounddef>
+</doxygen>
+"""
+
+TEMPLATE_XML = """<?xml version='1.0' encoding='UTF-8' standalone='no'?>
+<doxygen version="1.9.1">
+  <compounddef id="classbox" kind="class">
+    <compoundname>box</compoundname>
+    <sectiondef kind="public-func">
+      <memberdef kind="function" id="classbox_fill">
+        <templateparamlist><param><type>typename</type><declname>T</declname></param></templateparamlist>
+        <type>void</type>
+        <name>fill</name>
+        <argsstring>(T v, int n)</argsstring>
+        <param><type>T</type><declname>v</declname><defval>T()</defval></param>
+        <param><type>int</type><declname>n</declname></param>
+      </memberdef>
+    </sectiondef>
+  </compounddef>
+</doxygen>
+"""
+
+NAMESPACE_XML = """<?xml version='1.0' encoding='UTF-8' standalone='no'?>
+<doxygen version="1.9.1">
+  <compounddef id="namespacens" kind="namespace">
+    <compoundname>ns</compoundname>
+    <sectiondef kind="user-defined">
+      <memberdef kind="function" id="namespacens_run"><type>void</type><name>run</name><argsstring>()</argsstring></memberdef>
+    </sectiondef>
+    <sectiondef kind="func">
+      <memberdef kind="function" id="namespacens_run"><type>void</type><name>run</name><argsstring>()</argsstring></memberdef>
+      <memberdef kind="function" id="namespacens_stop"><type>void</type><name>stop</name><argsstring>()</argsstring></memberdef>
+    </sectiondef>
+  </compounddef>
+</doxygen>
+"""
+
+
+def _convert(tmp_path, text):
+    xml_file = tmp_path / 'compound.xml'
+    xml_file.write_text(text, encoding='utf-8')
+    out = io.StringIO()
+    assert DoxygenToMDXConverter({}).convert_file(str(xml_file), out)
+    return out.getvalue()
+
+
+def test_convert_file_to_writes_output(tmp_path):
+    xml_file = tmp_path / 'bar_8hpp.xml'
+    xml_file.write_text(FILE_XML, encoding='utf-8')
+    output_file = tmp_path / 'bar_8hpp.mdx'
+
+    assert DoxygenToMDXConverter({}).convert_file_to_path(str(xml_file), str(output_file))
+    assert '- `string`' in output_file.read_text(encoding='utf-8')
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['bar_8hpp.mdx', 'bar_8hpp.xml']
+
+
+def test_failed_reconvert_keeps_previous_output(tmp_path):
+    xml_file = tmp_path / 'bar_8hpp.xml'
+    xml_file.write_text('<doxygen><compounddef', encoding='utf-8')
+    output_file = tmp_path / 'bar_8hpp.mdx'
+    output_file.write_text('previous', encoding='utf-8')
+
+    assert not DoxygenToMDXConverter({}).convert_file_to_path(str(xml_file), str(output_file))
+    assert output_file.read_text(encoding='utf-8') == 'previous'
+    assert not (tmp_path / 'bar_8hpp.mdx.tmp').exists()
+
+
+def test_unwritable_output_reports_the_open_error(tmp_path, caplog):
+    xml_file = tmp_path / 'bar_8hpp.xml'
+    xml_file.write_text(FILE_XML, encoding='utf-8')
+    output_file = tmp_path / 'missing' / 'bar_8hpp.mdx'
+
+    assert not utils.convert_worker(DoxygenToMDXConverter, {}, str(xml_file), str(output_file))
+    assert 'No such file or directory' in caplog.text
+
+
+def test_render_error_fails_only_that_file(tmp_path, monkeypatch, caplog):
+    xml_file = tmp_path / 'bar_8hpp.xml'
+    xml_file.write_text(FILE_XML, encoding='utf-8')
+    output_file = tmp_path / 'bar_8hpp.mdx'
+
+    def fail(*_):
+        msg = 'boom'
+        raise ValueError(msg)
+
+    monkeypatch.setattr(DoxygenToMDXConverter, '_render_compound', fail)
+
+    assert not utils.convert_worker(DoxygenToMDXConverter, {}, str(xml_file), str(output_file))
+    assert not output_file.exists()
+    assert not (tmp_path / 'bar_8hpp.mdx.tmp').exists()
+    assert 'boom' in caplog.text
+
+
+def test_template_parameters_are_not_listed_as_function_parameters(tmp_path):
+    mdx = _convert(tmp_path, TEMPLATE_XML)
+
+    assert '#### Parameters\n\n- `v`: T()\n- `n`\n' in mdx
+    assert '- `T`' not in mdx
+
+
+def test_namespace_members_in_several_sections_are_rendered_once(tmp_path):
+    mdx = _convert(tmp_path, NAMESPACE_XML)
+
+    assert mdx.count('### `run()`') == 1
+    assert mdx.count('### `stop()`') == 1
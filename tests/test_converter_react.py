@@ -0,0 +1,141 @@
+import os
+
+import pytest
+
+from doxy2mdx.converter_mdx_with_react import DoxygenToMDXWithReactConverter
+from doxy2mdx.converter_react import DoxygenToReactConverter
+from doxy2mdx.converter_react_base import _DoxygenRendererBase
+from doxy2mdx.converter_simple import DoxygenToMDXConverter
+from doxy2mdx.utils import ET
+
+FILE_XML = """<?xml version='1.0' encoding='UTF-8' standalone='no'?>
+<doxygen version="1.9.1">
+  <compounddef id="bar_8hpp" kind="file" language="C++">
+    <compoundname>bar.hpp</compoundname>
+    <includes local="no">string</includes>
+    <briefdescription><para>Bar header.</para></briefdescription>
+    <detaileddescription></detaileddescription>
+  </compounddef>
+</doxygen>
+"""
+
+
+def _write_xml(tmp_path, text=FILE_XML):
+    xml_dir = tmp_path / 'xml'
+    xml_dir.mkdir(exist_ok=True)
+    (xml_dir / 'bar_8hpp.xml').write_text(text, encoding='utf-8')
+    return xml_dir
+
+
+def test_config_change_regenerates_output(tmp_path):
+    xml_dir = _write_xml(tmp_path)
+    out_dir = tmp_path / 'mdx'
+
+    DoxygenToMDXWithReactConverter({'jobs': 1, 'components_path': './a.jsx'}).convert_directory(xml_dir, out_dir)
+    DoxygenToMDXWithReactConverter({'jobs': 1, 'components_path': './b.jsx'}).convert_directory(xml_dir, out_dir)
+
+    assert "import Doxygen from './b.jsx';" in (out_dir / 'bar_8hpp.mdx').read_text(encoding='utf-8')
+
+
+def test_mode_change_regenerates_output(tmp_path):
+    xml_dir = _write_xml(tmp_path)
+    out_dir = tmp_path / 'mdx'
+
+    DoxygenToMDXConverter({'jobs': 1}).convert_directory(str(xml_dir), str(out_dir))
+    DoxygenToMDXWithReactConverter({'jobs': 1}).convert_directory(xml_dir, out_dir)
+
+    assert '<Doxygen.Section title="Includes">' in (out_dir / 'bar_8hpp.mdx').read_text(encoding='utf-8')
+
+
+def test_incremental_skips_up_to_date_output(tmp_path, capsys):
+    xml_dir = _write_xml(tmp_path)
+    out_dir = tmp_path / 'mdx'
+    out_dir.mkdir()
+    output_file = out_dir / 'bar_8hpp.mdx'
+    output_file.write_text('stale', encoding='utf-8')
+
+    # Make the existing output strictly newer than its XML
+    xml_mtime_ns = os.stat(xml_dir / 'bar_8hpp.xml').st_mtime_ns
+    os.utime(output_file, ns=(xml_mtime_ns + 10**9, xml_mtime_ns + 10**9))
+
+    DoxygenToMDXWithReactConverter({'jobs': 1, 'incremental': True}).convert_directory(xml_dir, out_dir)
+
+    assert output_file.read_text(encoding='utf-8') == 'stale'
+    assert 'Skipped 1 up-to-date files' in capsys.readouterr().out
+
+
+def test_renderer_base_requires_convert_file_to():
+    class Incomplete(_DoxygenRendererBase):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete({})
+
+
+def test_skip_prefixes_are_honoured(tmp_path):
+    xml_dir = _write_xml(tmp_path)
+    out_dir = tmp_path / 'mdx'
+
+    DoxygenToMDXWithReactConverter({'jobs': 1, 'skip_prefixes': ['bar_']}).convert_directory(xml_dir, out_dir)
+    DoxygenToMDXConverter({'jobs': 1, 'skip_prefixes': ['bar_']}).convert_directory(str(xml_dir), str(out_dir))
+
+    assert list(out_dir.iterdir()) == []
+
+
+def test_jsx_special_characters_are_escaped(tmp_path):
+    xml = FILE_XML.replace('<para>Bar header.</para>', '<para>Uses &lt;T&gt; and {braces} &amp; "quotes"</para>')
+    xml_dir = _write_xml(tmp_path, xml)
+
+    DoxygenToReactConverter({'jobs': 1}).convert_directory(xml_dir, tmp_path / 'jsx')
+    DoxygenToMDXWithReactConverter({'jobs': 1}).convert_directory(xml_dir, tmp_path / 'mdx')
+
+    escaped = 'Uses &lt;T&gt; and &#123;braces&#125; &amp; &quot;quotes&quot;'
+    assert f'<p className="doxygen-briefdescription">{escaped}</p>' in (tmp_path / 'jsx' / 'bar_8hpp.jsx').read_text(
+        encoding='utf-8'
+    )
+    assert f'<p className="doxygen-briefdescription">{escaped}</p>' in (tmp_path / 'mdx' / 'bar_8hpp.mdx').read_text(
+        encoding='utf-8'
+    )
+
+
+def test_mixed_inline_content_keeps_word_boundaries():
+    para = ET.fromstring(
+        '<para>Call <computeroutput>run()</computeroutput>then <bold>stop</bold>,\n'
+        '   see <ref refid="x">Foo</ref>.</para>'
+    )
+
+    text = DoxygenToReactConverter({})._render_paragraph_text(para)
+
+    assert text == 'Call run() then stop , see Foo .'
+
+
+def test_unwritable_output_does_not_stop_the_run(tmp_path, capsys):
+    xml_dir = _write_xml(tmp_path)
+    (xml_dir / 'struct_x.xml').write_text(FILE_XML.replace('bar_8hpp', 'struct_x'), encoding='utf-8')
+    out_dir = tmp_path / 'mdx'
+    (out_dir / 'bar_8hpp.mdx').mkdir(parents=True)
+
+    DoxygenToMDXWithReactConverter({'jobs': 1}).convert_directory(xml_dir, out_dir)
+
+    assert (out_dir / 'struct_x.mdx').is_file()
+    assert 'Converted: struct_x.xml -> struct_x.mdx' in capsys.readouterr().out
+
+
+def test_member_parameters_are_compact_json_with_escaped_angle_brackets(tmp_path):
+    xml = FILE_XML.replace('kind="file"', 'kind="class"').replace(
+        '<detaileddescription></detaileddescription>',
+        '<detaileddescription></detaileddescription>\n'
+        '    <sectiondef kind="public-func">\n'
+        '      <memberdef kind="function" id="bar_8hpp_fill">\n'
+        '        <type>void</type><name>fill</name><argsstring>(std::vector&lt;int&gt; v)</argsstring>\n'
+        '        <param><type>std::vector&lt;int&gt;</type><declname>v</declname>'
+        '<defval>std::vector&lt;int&gt;()</defval></param>\n'
+        '      </memberdef>\n'
+        '    </sectiondef>',
+    )
+    xml_dir = _write_xml(tmp_path, xml)
+
+    DoxygenToMDXWithReactConverter({'jobs': 1}).convert_directory(xml_dir, tmp_path / 'mdx')
+
+    mdx = (tmp_path / 'mdx' / 'bar_8hpp.mdx').read_text(encoding='utf-8')
+    assert 'parameters={[{"name":"v","description":"std::vector\\u003cint\\u003e()"}]}' in mdx
@@ -0,0 +1,104 @@
+from doxy2mdx.converter_simple import DoxygenToMDXConverter
+
+CLASS_XML = """<?xml version='1.0' encoding='UTF-8' standalone='no'?>
+<doxygen version="1.9.1">
+  <compounddef id="class{n}" kind="class">
+    <compoundname>C{n}</compoundname>
+    <briefdescription><para>Class {n}.</para></briefdescription>
+    <sectiondef kind="public-func">
+      <memberdef kind="function" id="class{n}_run">
+        <type>int</type>
+        <name>run</name>
+        <argsstring>(int x)</argsstring>
+        <param><type>int</type><declname>x</declname></param>
+        <briefdescription><para>Run it.</para></briefdescription>
+      </memberdef>
+    </sectiondef>
+  </compounddef>
+</doxygen>
+"""
+
+
+def test_parallel_directory_matches_single_file(tmp_path):
+    xml_dir = tmp_path / 'xml'
+    xml_dir.mkdir()
+    for n in range(20):
+        (xml_dir / f'class{n}.xml').write_text(CLASS_XML.format(n=n), encoding='utf-8')
+    (xml_dir / 'index.xml').write_text('<doxygenindex/>', encoding='utf-8')
+    out_dir = tmp_path / 'mdx'
+
+    converter = DoxygenToMDXConverter({'jobs': 4})
+    converter.convert_directory(str(xml_dir), str(out_dir))
+
+    assert sorted(p.name for p in out_dir.iterdir()) == sorted(f'class{n}.mdx' for n in range(20))
+    for n in range(20):
+        expected = converter.convert_file(str(xml_dir / f'class{n}.xml'))
+        assert (out_dir / f'class{n}.mdx').read_text(encoding='utf-8') == expected
+    assert '### `run(int x)`' in expected
+
+
+def test_broken_file_does_not_stop_the_run(tmp_path):
+    xml_dir = tmp_path / 'xml'
+    xml_dir.mkdir()
+    (xml_dir / 'broken.xml').write_text('<doxygen><compounddef', encoding='utf-8')
+    (xml_dir / 'class1.xml').write_text(CLASS_XML.format(n=1), encoding='utf-8')
+    out_dir = tmp_path / 'mdx'
+
+    DoxygenToMDXConverter({'jobs': 2}).convert_directory(str(xml_dir), str(out_dir))
+
+    assert [p.name for p in out_dir.iterdir()] == ['class1.mdx']
+
+
+def test_unwritable_output_does_not_stop_the_run(tmp_path):
+    xml_dir = tmp_path / 'xml'
+    xml_dir.mkdir()
+    for n in range(3):
+        (xml_dir / f'class{n}.xml').write_text(CLASS_XML.format(n=n), encoding='utf-8')
+    out_dir = tmp_path / 'mdx'
+    (out_dir / 'class0.mdx').mkdir(parents=True)
+
+    DoxygenToMDXConverter({'jobs': 1}).convert_directory(str(xml_dir), str(out_dir))
+
+    assert (out_dir / 'class1.mdx').is_file()
+    assert (out_dir / 'class2.mdx').is_file()
+
+
+def test_empty_unknown_inline_elements_are_skipped(tmp_path):
+    xml = CLASS_XML.format(n=1).replace(
+        '<para>Class 1.</para>', '<para>Line one<linebreak/>line two<anchor id="a"/>.</para>'
+    )
+    xml_file = tmp_path / 'class1.xml'
+    xml_file.write_text(xml, encoding='utf-8')
+
+    mdx = DoxygenToMDXConverter({}).convert_file(str(xml_file))
+
+    assert mdx is not None
+    assert 'Line one  line two  .' in mdx
+
+
+def test_missing_file_is_reported_as_a_read_error(tmp_path, caplog):
+    assert DoxygenToMDXConverter({}).convert_file(str(tmp_path / 'missing.xml')) is None
+    assert 'Error reading XML file' in caplog.text
+
+
+def test_convert_file_from_bytes_matches_convert_file(tmp_path):
+    xml_file = tmp_path / 'class1.xml'
+    xml_file.write_text(CLASS_XML.format(n=1), encoding='utf-8')
+    converter = DoxygenToMDXConverter({})
+
+    assert converter.convert_file_from_bytes(xml_file.read_bytes()) == converter.convert_file(str(xml_file))
+
+
+def test_template_parameters_are_not_listed_as_function_parameters(tmp_path):
+    xml = CLASS_XML.format(n=1).replace(
+        '<type>int</type>\n        <name>run</name>',
+        '<templateparamlist><param><type>typename</type><declname>T</declname></param></templateparamlist>\n'
+        '        <type>int</type>\n        <name>run</name>',
+    )
+    xml_file = tmp_path / 'class1.xml'
+    xml_file.write_text(xml, encoding='utf-8')
+
+    mdx = DoxygenToMDXConverter({}).convert_file(str(xml_file))
+
+    assert '#### Parameters\n\n- `x`\n' in mdx
+    assert '- `T`' not in mdx
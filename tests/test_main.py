@@ -0,0 +1,19 @@
+import sys
+
+from doxy2mdx.__main__ import load_config, parse_args
+
+
+def test_yaml_config_keeps_jobs_and_skip_prefixes(tmp_path):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('jobs: 2\nskip_prefixes: [index, dir_]\n', encoding='utf-8')
+
+    config = load_config(str(config_file))
+
+    assert config['jobs'] == 2
+    assert config['skip_prefixes'] == ['index', 'dir_']
+
+
+def test_jobs_flag_overrides_config(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['doxy2mdx', '--jobs', '3'])
+
+    assert parse_args()['jobs'] == 3
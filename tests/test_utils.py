@@ -0,0 +1,61 @@
+import io
+import os
+import stat
+
+from doxy2mdx import utils
+
+XML = b"""<?xml version='1.0' encoding='UTF-8' standalone='no'?>
+<doxygen version="1.9.1">
+  <compounddef id="classfoo" kind="class">
+    <compoundname>foo</compoundname>
+    <briefdescription><para>Foo <computeroutput>bar</computeroutput> baz.</para></briefdescription>
+  </compounddef>
+</doxygen>
+"""
+
+
+def test_parse_compounddef(tmp_path):
+    xml_file = tmp_path / 'classfoo.xml'
+    xml_file.write_bytes(XML)
+
+    compound = utils.parse_compounddef(str(xml_file))
+
+    assert compound.tag == 'compounddef'
+    assert compound.get('id') == 'classfoo'
+    assert compound.findtext('compoundname') == 'foo'
+    assert ''.join(compound.find('briefdescription/para').itertext()) == 'Foo bar baz.'
+
+
+def test_parse_compounddef_file_object():
+    assert utils.parse_compounddef(io.BytesIO(XML)).get('kind') == 'class'
+
+
+def test_parse_compounddef_without_compound():
+    assert utils.parse_compounddef(io.BytesIO(b'<doxygen version="1.9.1"/>')) is None
+
+
+def test_compile_path():
+    compound = utils.parse_compounddef(io.BytesIO(XML))
+
+    assert [e.tag for e in utils.compile_path('.//para')(compound)] == ['para']
+
+
+def test_write_text_replaces_content(tmp_path):
+    path = tmp_path / 'out.mdx'
+    path.write_text('a much longer previous content', encoding='utf-8')
+
+    utils.write_text(str(path), 'new ✓')
+
+    assert path.read_text(encoding='utf-8') == 'new ✓'
+
+
+def test_write_text_honours_umask_and_cleans_up(tmp_path):
+    path = tmp_path / 'out.mdx'
+    old_umask = os.umask(0o022)
+    try:
+        utils.write_text(str(path), 'text')
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert [p.name for p in tmp_path.iterdir()] == ['out.mdx']